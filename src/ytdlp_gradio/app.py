@@ -1,65 +1,173 @@
+import contextvars
 import os
 import gradio as gr
-import yt_dlp
 import re
 import platform
-from dataclasses import dataclass
+import queue
+import shelve
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Any, Callable
 
+# Evaluated once at import - platform.system() can hit a syscall and the
+# default download dir never changes for the life of the process
+_IS_WINDOWS = platform.system().lower() == "windows"
+_DEFAULT_DOWNLOAD_DIR = os.path.join(os.getcwd(), "downloads")
+
+# Output directories already created this session - skips the makedirs
+# stat() on every download request
+_ENSURED_DIRS = set()
+
+# Compiled once at import time - runs on every progress callback
+_FORMAT_SUFFIX_RE = re.compile(r'\.f\d+$')
+
+# Errors that indicate the MP3 post-processing step failed and the download
+# should be retried with M4A; one case-insensitive alternation scans the
+# message in a single pass
+_AUDIO_FAIL_RE = re.compile(r'mp3|audio conversion failed|encoder not found|postprocessor',
+                            re.IGNORECASE)
+
 # URL Utilities
+#
+# These are plain substring tests: the patterns are literal (the old
+# regexes only used '.' as a metacharacter, unintentionally), and
+# str.__contains__ runs entirely in C with none of the regex engine's
+# per-call overhead.
 def is_vimeo_url(url: str) -> bool:
     """Check if the URL is from Vimeo"""
-    return re.search(r'vimeo\.com', url) is not None
+    return 'vimeo.com' in url
 
 def is_vimeo_showcase(url: str) -> bool:
     """Check if the URL is a Vimeo showcase"""
-    return re.search(r'vimeo\.com/showcase/', url) is not None
+    return 'vimeo.com/showcase/' in url
 
 def is_playlist(url: str) -> bool:
     """Check if the URL is a playlist (YouTube or Vimeo showcase)"""
     # YouTube playlist detection
-    if re.search(r'youtube\.com/playlist', url) or re.search(r'youtube\.com/.*list=', url):
+    if 'youtube.com/playlist' in url or ('youtube.com/' in url and 'list=' in url):
         return True
     # Vimeo showcase detection
-    return is_vimeo_showcase(url)
+    return 'vimeo.com/showcase/' in url
+
+# Metadata Cache
+#
+# Playlist probes are pure network latency, and users frequently re-enter
+# the same URL; remember probe results on disk across runs. Entries carry a
+# timestamp and age out after _META_CACHE_TTL seconds.
+_META_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ytdlp_gradio")
+_META_CACHE_TTL = 3600  # seconds
+
+# Query parameters that identify the click, not the video - stripped before
+# the URL is used as a cache key
+_TRACKING_PARAMS = frozenset({'feature', 'fbclid', 'gclid', 'si'})
+
+_meta_cache = None
+_meta_cache_lock = threading.Lock()
+
+def _open_meta_cache():
+    """Open the on-disk metadata cache lazily (once per process)"""
+    global _meta_cache
+    if _meta_cache is None:
+        with _meta_cache_lock:
+            if _meta_cache is None:
+                os.makedirs(_META_CACHE_DIR, exist_ok=True)
+                _meta_cache = shelve.open(os.path.join(_META_CACHE_DIR, "metadata"))
+    return _meta_cache
+
+def normalize_url(url: str) -> str:
+    """Strip tracking query parameters so equivalent URLs share a cache key"""
+    parts = urllib.parse.urlsplit(url)
+    if not parts.query:
+        return url
+    kept = [(k, v) for k, v in urllib.parse.parse_qsl(parts.query)
+            if k not in _TRACKING_PARAMS and not k.startswith('utm_')]
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(kept)))
+
+def peek_cached_info(url: str) -> Optional[Dict]:
+    """Return the cached info dict for a URL if present and still fresh
+
+    The cache only feeds instant counts and UI hints; downloads always run
+    a fresh probe so videos added since the cache entry are never skipped.
+    """
+    key = normalize_url(url)
+    cache = _open_meta_cache()
+    with _meta_cache_lock:
+        record = cache.get(key)
+    if record is not None and time.time() - record['ts'] < _META_CACHE_TTL:
+        return record['info']
+    return None
+
+def store_cached_info(url: str, info: Dict) -> None:
+    """Record a freshly probed info dict for a URL"""
+    cache = _open_meta_cache()
+    with _meta_cache_lock:
+        cache[normalize_url(url)] = {'ts': time.time(), 'info': info}
+        cache.sync()
+
+def clear_meta_cache() -> None:
+    """Drop every cached metadata record"""
+    cache = _open_meta_cache()
+    with _meta_cache_lock:
+        cache.clear()
+        cache.sync()
+
+# Post-processor templates shared by every DownloadConfig; stored as tuples
+# so instances clone rather than alias the mutable list
+_PP_VIDEO_MP4 = ({
+    'key': 'FFmpegVideoConvertor',
+    'preferedformat': 'mp4',
+},)
+_PP_AUDIO_MP3 = ({
+    'key': 'FFmpegExtractAudio',
+    'preferredcodec': 'mp3',
+    'preferredquality': '192',
+},)
+_PP_AUDIO_M4A = ({
+    'key': 'FFmpegExtractAudio',
+    'preferredcodec': 'm4a',
+    'preferredquality': '192',
+},)
 
 # Download Configuration
-@dataclass
+@dataclass(slots=True)
 class DownloadConfig:
     url: str
     video_password: Optional[str] = None
     audio_only: bool = False
-    output_dir: str = os.path.join(os.getcwd(), "downloads")
-    
+    output_dir: str = field(default_factory=lambda: _DEFAULT_DOWNLOAD_DIR)
+    max_workers: int = 4  # Parallel playlist-entry downloads
+    # Derived in __post_init__; declared here so slots are allocated for them
+    format_option: str = field(init=False, default=None)
+    file_extension: str = field(init=False, default=None)
+    preferred_codec: Optional[str] = field(init=False, default=None)
+    post_processors: List[Dict] = field(init=False, default=None)
+
     def __post_init__(self):
-        # Create output directory if it doesn't exist
-        os.makedirs(self.output_dir, exist_ok=True)
+        # Create output directory if it doesn't exist (once per directory)
+        if self.output_dir not in _ENSURED_DIRS:
+            os.makedirs(self.output_dir, exist_ok=True)
+            _ENSURED_DIRS.add(self.output_dir)
         
         # Set format based on audio_only flag
         if self.audio_only:
             self.format_option = "bestaudio"
             
             # Use m4a on Windows, mp3 on other platforms
-            is_windows = platform.system().lower() == "windows"
-            if is_windows:
+            if _IS_WINDOWS:
                 self.file_extension = "m4a"
                 self.preferred_codec = "m4a"
+                self.post_processors = list(_PP_AUDIO_M4A)
             else:
                 self.file_extension = "mp3"
                 self.preferred_codec = "mp3"
-                
-            self.post_processors = [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': self.preferred_codec,
-                'preferredquality': '192',
-            }]
+                self.post_processors = list(_PP_AUDIO_MP3)
         else:
             self.format_option = "bestvideo+bestaudio"
             self.file_extension = "mp4"
-            self.post_processors = [{
-                'key': 'FFmpegVideoConvertor',
-                'preferedformat': 'mp4',
-            }]
+            self.post_processors = list(_PP_VIDEO_MP4)
     
     def get_ydl_opts(self, progress_hook: Callable) -> Dict:
         """Generate yt-dlp options dictionary"""
@@ -71,6 +179,7 @@ class DownloadConfig:
             'progress_hooks': [progress_hook],
             'verbose': is_playlist(self.url),  # Enable verbose output for playlists
             'ignoreerrors': True,  # Skip private or unavailable videos in playlists
+            'concurrent_fragment_downloads': 4,  # Parallel fragments for DASH/HLS streams
             'postprocessors': self.post_processors,
             'merge_output_format': 'mp4' if not self.audio_only else None,  # Ensure merged formats are mp4
         }
@@ -84,92 +193,278 @@ class DownloadConfig:
     def update_to_m4a(self):
         """Update config to use M4A format instead of MP3"""
         if self.audio_only:
-            self.post_processors[0]['preferredcodec'] = 'm4a'
+            # Swap the whole template rather than mutating the shared dict
+            self.post_processors = list(_PP_AUDIO_M4A)
             self.file_extension = "m4a"
             self.preferred_codec = "m4a"
 
+# Process-wide pool of idle YoutubeDL instances keyed by the immutable
+# subset of their options. Constructing a YoutubeDL rebuilds the extractor
+# registry every time, which dwarfs the per-download Python work; reusing
+# instances keeps that cost out of the steady-state click path. Instances
+# are checked out (removed) while in use so two downloads never share one.
+#
+# yt-dlp itself is imported lazily: pulling in its ~1800 extractors takes a
+# noticeable fraction of a second that would otherwise delay app startup.
+_YDL_POOL: Dict[tuple, List["yt_dlp.YoutubeDL"]] = {}
+_YDL_POOL_LOCK = threading.Lock()
+
+def _ydl_pool_key(ydl_opts: Dict) -> tuple:
+    """Build a hashable pool key from the reusable ydl options"""
+    return (
+        ydl_opts.get('format'),
+        ydl_opts.get('outtmpl'),
+        ydl_opts.get('merge_output_format'),
+        ydl_opts.get('verbose'),
+        ydl_opts.get('extract_flat'),
+        ydl_opts.get('skip_download'),
+        tuple(tuple(sorted(pp.items())) for pp in ydl_opts.get('postprocessors') or ()),
+    )
+
+def _acquire_ydl(ydl_opts: Dict) -> Tuple[tuple, "yt_dlp.YoutubeDL"]:
+    """Check a YoutubeDL instance out of the pool, creating one on miss"""
+    import yt_dlp  # Deferred - see pool comment above
+
+    key = _ydl_pool_key(ydl_opts)
+    with _YDL_POOL_LOCK:
+        idle = _YDL_POOL.get(key)
+        ydl = idle.pop() if idle else None
+
+    if ydl is None:
+        # YoutubeDL normalizes the dict it is given in place (e.g. outtmpl
+        # becomes a dict); hand it a copy so the caller's opts stay usable
+        # for key computation
+        ydl = yt_dlp.YoutubeDL(dict(ydl_opts))
+    else:
+        # Refresh the per-request parameters on the reused instance
+        if 'videopassword' in ydl_opts:
+            ydl.params['videopassword'] = ydl_opts['videopassword']
+        else:
+            ydl.params.pop('videopassword', None)
+        ydl._progress_hooks.clear()
+        for hook in ydl_opts.get('progress_hooks', []):
+            ydl.add_progress_hook(hook)
+    return key, ydl
+
+def _release_ydl(key: tuple, ydl: "yt_dlp.YoutubeDL") -> None:
+    """Return a YoutubeDL instance to the pool for reuse
+
+    Only call this after a successful operation - an instance that raised
+    mid-download is in an unknown state and must go through _discard_ydl
+    instead of being handed to an unrelated request.
+    """
+    with _YDL_POOL_LOCK:
+        _YDL_POOL.setdefault(key, []).append(ydl)
+
+def _discard_ydl(ydl: "yt_dlp.YoutubeDL") -> None:
+    """Close a YoutubeDL whose state is suspect instead of repooling it"""
+    try:
+        ydl.close()
+    except Exception:
+        pass
+
+# Sentinel telling the progress pump thread to exit
+_PROGRESS_STOP = object()
+
 # Download Manager
 class DownloadManager:
     def __init__(self, config: DownloadConfig, progress: gr.Progress):
         self.config = config
         self.progress = progress
         self.current_video = {"num": 0, "total": 1, "title": ""}
+        # The URL never changes for the life of the manager, so classify it
+        # once instead of re-running the regexes on every progress callback
+        self._is_playlist = is_playlist(config.url)
+        self._is_showcase = is_vimeo_showcase(config.url)
+        # Throttle state for progress_hook - see below
+        self._last_emit_t = 0.0
+        self._last_emit_pct = -1.0
+        self._last_emit_bytes = 0
+        # Guards current_video/title_seen when playlist entries download in
+        # parallel worker threads
+        self._lock = threading.Lock()
+        # Progress updates are handed to a background pump thread through a
+        # single-slot queue so the download loop never blocks on the UI
+        self._progress_q = queue.Queue(maxsize=1)
+        self._progress_thread = None
+        # Per-entry completion lines, drained by download_video's generator
+        # so the status box fills in as videos finish; titles already
+        # announced, since 'finished' fires once per format file
+        self.interim_messages = queue.Queue()
+        self._completed_titles = set()
+
+    def _start_progress_pump(self) -> None:
+        """Start the thread that forwards queued updates to Gradio"""
+        # gr.Progress resolves its callback through contextvars set on the
+        # event-handler thread; a fresh thread starts with an empty context
+        # and every update would be silently dropped. Run the pump inside a
+        # copy of the caller's context.
+        ctx = contextvars.copy_context()
+        self._progress_thread = threading.Thread(target=ctx.run, args=(self._pump_progress,),
+                                                 daemon=True)
+        self._progress_thread.start()
+
+    def _stop_progress_pump(self) -> None:
+        """Flush pending updates and stop the pump thread"""
+        if self._progress_thread is not None:
+            self._progress_q.put(_PROGRESS_STOP)
+            self._progress_thread.join(timeout=5)
+            self._progress_thread = None
+
+    def _pump_progress(self) -> None:
+        while True:
+            item = self._progress_q.get()
+            if item is _PROGRESS_STOP:
+                break
+            pct, desc = item
+            try:
+                self.progress(pct, desc=desc)
+            except Exception:
+                # A UI hiccup must never kill the pump mid-download
+                pass
+
+    def _emit(self, pct, desc: str = None) -> None:
+        """Queue a progress update without blocking the caller
+
+        The queue holds one pending update; if the UI is lagging, the stale
+        entry is replaced instead of making the download thread wait.
+        """
+        if self._progress_thread is None:
+            # Pump not running (e.g. direct calls in tests) - emit inline
+            self.progress(pct, desc=desc)
+            return
+        try:
+            self._progress_q.put_nowait((pct, desc))
+        except queue.Full:
+            try:
+                self._progress_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._progress_q.put_nowait((pct, desc))
+            except queue.Full:
+                pass
         
     def progress_hook(self, d: Dict) -> None:
         """Progress hook for yt-dlp"""
         if d['status'] == 'downloading':
-            filename = d.get('filename', '').split('/')[-1]
-            
+            # yt-dlp fires this hook for every network chunk, but each
+            # self._emit(...) call crosses into Gradio's progress channel.
+            # Coalesce updates: emit only when enough time has passed, enough
+            # bytes arrived, or the percentage moved noticeably. 'finished'
+            # events below are never dropped.
+            downloaded = d.get('downloaded_bytes', 0)
+            if d.get('total_bytes'):
+                pct = downloaded / d['total_bytes']
+            else:
+                pct = -1.0
+            now = time.monotonic()
+            if (now - self._last_emit_t < 0.25
+                    and downloaded - self._last_emit_bytes < 1048576
+                    and abs(pct - self._last_emit_pct) < 0.005):
+                return
+            self._last_emit_t = now
+            self._last_emit_pct = pct
+            self._last_emit_bytes = downloaded
+
+            filename = os.path.basename(d.get('filename') or '')
+
             # Extract the title from the filename (remove extension)
             title = os.path.splitext(filename)[0]
             # Further clean up the title by removing any format identifiers
             # This helps with files that have format info like "video.f137.mp4"
-            title = re.sub(r'\.f\d+$', '', title)
+            title = _FORMAT_SUFFIX_RE.sub('', title)
             
+            # If the flat probe could not determine a total (some extractors
+            # return no flat entries), fall back to the entry count yt-dlp
+            # ships with each hook event
+            if self._is_playlist and self.current_video["total"] <= 1:
+                n_entries = d.get('info_dict', {}).get('n_entries')
+                if n_entries:
+                    self.current_video["total"] = n_entries
+
             # For playlists, show which video is being downloaded
             prefix = ""
-            if is_playlist(self.config.url) and self.current_video["total"] > 1:
-                # Initialize title_seen set if it doesn't exist
-                if not hasattr(self, 'title_seen'):
-                    self.title_seen = set()
-                    
-                # Check if this is a new title we haven't seen before
-                if title not in self.title_seen:
-                    self.title_seen.add(title)
-                    # Update the counter to match the number of unique titles
-                    self.current_video["num"] = len(self.title_seen)
-                
-                prefix = f"Video {self.current_video['num']}/{self.current_video['total']}: "
-                self.current_video["title"] = title
+            if self._is_playlist and self.current_video["total"] > 1:
+                with self._lock:
+                    # Initialize title_seen set if it doesn't exist
+                    if not hasattr(self, 'title_seen'):
+                        self.title_seen = set()
+
+                    # Check if this is a new title we haven't seen before
+                    if title not in self.title_seen:
+                        self.title_seen.add(title)
+                        # Update the counter to match the number of unique titles
+                        self.current_video["num"] = len(self.title_seen)
+
+                    prefix = f"Video {self.current_video['num']}/{self.current_video['total']}: "
+                    self.current_video["title"] = title
             
             if d.get('total_bytes'):
-                percentage = d['downloaded_bytes'] / d['total_bytes']
+                percentage = pct
                 # For playlists, scale the percentage to the current video's portion of the total
-                if is_playlist(self.config.url) and self.current_video["total"] > 1:
+                if self._is_playlist and self.current_video["total"] > 1:
                     # Calculate overall progress: completed videos + current video progress
                     overall_percentage = ((self.current_video["num"] - 1) + percentage) / self.current_video["total"]
-                    self.progress(overall_percentage, desc=f"{prefix}Downloading: {filename}")
+                    self._emit(overall_percentage, desc=f"{prefix}Downloading: {filename}")
                 else:
-                    self.progress(percentage, desc=f"{prefix}Downloading: {filename}")
+                    self._emit(percentage, desc=f"{prefix}Downloading: {filename}")
             elif d.get('downloaded_bytes'):
                 # For streams where total size is unknown
-                if is_playlist(self.config.url) and self.current_video["total"] > 1:
+                mb = d['downloaded_bytes'] / 1048576
+                if self._is_playlist and self.current_video["total"] > 1:
                     # For unknown size, estimate progress based on downloaded bytes
                     # Use a small increment to show activity
                     overall_percentage = (self.current_video["num"] - 1) / self.current_video["total"]
                     # Add a small fraction to show progress within current video
                     overall_percentage += 0.5 / self.current_video["total"]
-                    self.progress(overall_percentage, desc=f"{prefix}Downloading: {filename} ({d['downloaded_bytes'] / 1024 / 1024:.1f} MB)")
+                    self._emit(overall_percentage, desc=f"{prefix}Downloading: {filename} ({mb:.1f} MB)")
                 else:
-                    self.progress(None, desc=f"{prefix}Downloading: {filename} ({d['downloaded_bytes'] / 1024 / 1024:.1f} MB)")
+                    self._emit(None, desc=f"{prefix}Downloading: {filename} ({mb:.1f} MB)")
         elif d['status'] == 'finished':
-            filename = d.get('filename', '').split('/')[-1]
+            filename = os.path.basename(d.get('filename') or '')
             title = os.path.splitext(filename)[0]
-            title = re.sub(r'\.f\d+$', '', title)
-            
-            if is_playlist(self.config.url) and self.current_video["total"] > 1:
+            title = _FORMAT_SUFFIX_RE.sub('', title)
+
+            # yt-dlp fires 'finished' once per format file (e.g. the .f137
+            # video track, then the audio track); after the suffix strip
+            # they share a title, so only the first event for a title
+            # streams a completion line
+            with self._lock:
+                first_finish = title not in self._completed_titles
+                if first_finish:
+                    self._completed_titles.add(title)
+
+            if self._is_playlist and self.current_video["total"] > 1:
                 # Don't increment the counter here, as we do it in the downloading status
                 # based on unique titles
-                self.progress(self.current_video['num'] / self.current_video['total'], 
+                self._emit(self.current_video['num'] / self.current_video['total'],
                          desc=f"Video {self.current_video['num']}/{self.current_video['total']} complete, processing...")
+                if first_finish:
+                    self.interim_messages.put(
+                        f"Video {self.current_video['num']}/{self.current_video['total']} complete: {title}")
             else:
-                self.progress(1.0, desc="Download complete, processing file...")
+                self._emit(1.0, desc="Download complete, processing file...")
+                if first_finish:
+                    self.interim_messages.put(f"Completed: {title}")
     
     def download(self) -> Tuple[str, Any]:
         """Execute the download process and return results"""
         if not self.config.url:
             return "Please enter a URL", None
-        
+
+        # Updates flow through the pump thread for the whole download
+        self._start_progress_pump()
         try:
-            self.progress(0, desc="Starting download...")
+            self._emit(0, desc="Starting download...")
             
             # For playlists, provide more detailed information
-            if is_playlist(self.config.url):
-                playlist_type = "Vimeo showcase" if is_vimeo_showcase(self.config.url) else "YouTube playlist"
-                self.progress(0.01, desc=f"Processing {playlist_type} - this may take longer...")
+            if self._is_playlist:
+                playlist_type = "Vimeo showcase" if self._is_showcase else "YouTube playlist"
+                self._emit(0.01, desc=f"Processing {playlist_type} - this may take longer...")
                 result_message = f"Downloading from {playlist_type} ({('audio only' if self.config.audio_only else 'video')}:\n\n"
             else:
-                self.progress(0.01, desc="Extracting video information...")
+                self._emit(0.01, desc="Extracting video information...")
                 result_message = ""
                 
             # Try to download with current config
@@ -177,10 +472,8 @@ class DownloadManager:
                 info, result_message = self._perform_download()
             except Exception as e:
                 # Check for audio conversion failure
-                error_str = str(e).lower()
-                if self.config.audio_only and ("mp3" in error_str or "audio conversion failed" in error_str or 
-                                  "encoder not found" in error_str or "postprocessor" in error_str):
-                    self.progress(0.1, desc="MP3 conversion failed, trying M4A format instead...")
+                if self.config.audio_only and _AUDIO_FAIL_RE.search(str(e)):
+                    self._emit(0.1, desc="MP3 conversion failed, trying M4A format instead...")
                     # Update options to use m4a
                     self.config.update_to_m4a()
                     info, result_message = self._perform_download()
@@ -189,7 +482,7 @@ class DownloadManager:
                     # Re-raise the exception if it's not related to mp3 conversion
                     raise
             
-            self.progress(1.0, desc="Download complete!")
+            self._emit(1.0, desc="Download complete!")
             
             # Create a notification message
             notification_msg = self._create_notification(info)
@@ -198,89 +491,177 @@ class DownloadManager:
             return result_message, gr.Success(notification_msg)
         except Exception as e:
             error_message = f"Error: {str(e)}"
-            if is_playlist(self.config.url):
+            if self._is_playlist:
                 error_message += "\n\nFor playlists, some videos might be unavailable or restricted."
-                if is_vimeo_showcase(self.config.url):
+                if self._is_showcase:
                     error_message += "\nFor Vimeo showcases, make sure you have the correct password if it's protected."
             return error_message, gr.Warning("Download failed. See details in the result box.")
+        finally:
+            # Flush whatever is still queued and retire the pump thread
+            self._stop_progress_pump()
     
     def _perform_download(self) -> Tuple[Dict, str]:
         """Execute the actual download with yt-dlp"""
         ydl_opts = self.config.get_ydl_opts(self.progress_hook)
         result_message = ""
         
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            # First extract info without downloading to get total count for playlists
-            info_dict = ydl.extract_info(self.config.url, download=False)
-            
-            if 'entries' in info_dict and is_playlist(self.config.url):
+        # For playlists, probe with a flat extraction first - it only lists the
+        # entries instead of fetching full metadata for each video, so the
+        # count is cheap. Single videos skip the probe entirely; the old
+        # download=False pre-pass re-extracted the whole playlist and doubled
+        # startup latency.
+        if self._is_playlist:
+            probe_opts = {**ydl_opts, 'extract_flat': 'in_playlist', 'skip_download': True}
+
+            def _probe(url):
+                probe_key, probe = _acquire_ydl(probe_opts)
+                try:
+                    result = probe.extract_info(url, download=False)
+                except Exception:
+                    _discard_ydl(probe)
+                    raise
+                _release_ydl(probe_key, probe)
+                return result
+
+            # A cached probe gives the UI an instant count, but the entry
+            # list that is actually downloaded must come from a fresh probe:
+            # a playlist can gain videos within the TTL and a cached listing
+            # would silently skip them
+            cached = peek_cached_info(self.config.url)
+            if cached and cached.get('entries'):
+                self._emit(0.01, desc=f"Playlist had {len(cached['entries'])} videos last time - refreshing...")
+
+            info_dict = _probe(self.config.url)
+            if info_dict is not None:
+                store_cached_info(self.config.url, info_dict)
+
+            if info_dict and 'entries' in info_dict:
                 # Filter out None entries (private/unavailable videos)
                 available_entries = [entry for entry in info_dict['entries'] if entry is not None]
-                
+
                 # Count unique video titles to avoid counting multiple formats of the same video
                 unique_titles = set(entry.get('title', '') for entry in available_entries if entry)
                 self.current_video["total"] = len(unique_titles)
                 self.current_video["num"] = 1
-                
+
                 # Create a mapping of titles to track which videos we've seen
                 self.title_seen = set()
-                
-                self.progress(0.02, desc=f"Found {self.current_video['total']} available videos in playlist. Starting downloads...")
-            
-            # Now do the actual download
+
+                self._emit(0.02, desc=f"Found {self.current_video['total']} available videos in playlist. Starting downloads...")
+
+                # yt-dlp downloads playlist entries strictly sequentially, so
+                # wall-clock time is bounded by per-video startup rather than
+                # bandwidth. Dispatch entries to a small thread pool instead,
+                # keeping one slot per probe entry so private or unavailable
+                # items still appear as skipped at their original positions.
+                entry_urls = [entry and (entry.get('url') or entry.get('webpage_url'))
+                              for entry in info_dict['entries']]
+                if any(entry_urls):
+                    # Pool threads start with an empty contextvars context,
+                    # which would stop gr.Progress resolving inside
+                    # progress_hook; give each task a copy of ours
+                    ctx = contextvars.copy_context()
+                    with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+                        futures = [executor.submit(ctx.copy().run, self._download_one, u)
+                                   if u else None
+                                   for u in entry_urls]
+                        entries = [f.result() if f is not None else None for f in futures]
+                    info = {'title': info_dict.get('title', 'Unknown'), 'entries': entries}
+                    result_message = self._format_playlist_result(info)
+                    return info, result_message
+
+        key, ydl = _acquire_ydl(ydl_opts)
+        try:
+            # Do the actual download
             info = ydl.extract_info(self.config.url, download=True)
-            
-            # Process the results
-            if 'entries' in info:  # It's a playlist
-                result_message += self._format_playlist_result(info)
-            else:  # It's a single video
-                result_message += self._format_single_video_result(info)
-                
+        except Exception:
+            _discard_ydl(ydl)
+            raise
+        _release_ydl(key, ydl)
+
+        # Process the results
+        if 'entries' in info:  # It's a playlist
+            result_message = self._format_playlist_result(info)
+        else:  # It's a single video
+            result_message = self._format_single_video_result(info)
+
         return info, result_message
-    
+
+    def _download_one(self, entry_url: str) -> Optional[Dict]:
+        """Download a single playlist entry in a worker thread"""
+        # YoutubeDL instances are not safe to share across threads, so each
+        # worker checks its own out of the pool
+        ydl_opts = self.config.get_ydl_opts(self.progress_hook)
+        key, ydl = _acquire_ydl(ydl_opts)
+        try:
+            info = ydl.extract_info(entry_url, download=True)
+        except Exception:
+            # Match ignoreerrors behaviour: failed entries are reported as
+            # skipped items in the playlist summary
+            _discard_ydl(ydl)
+            return None
+        _release_ydl(key, ydl)
+        return info
+
     def _format_playlist_result(self, info: Dict) -> str:
         """Format the result message for a playlist download"""
         playlist_title = info.get('title', 'Unknown')
-        
-        # Count only non-None entries (available videos)
-        available_entries = [entry for entry in info['entries'] if entry is not None]
-        
-        # Count unique video titles to avoid counting multiple parts of the same video
-        unique_titles = set(entry.get('title', '') for entry in available_entries if entry)
-        entry_count = len(unique_titles)
-        total_entries = len(info['entries'])
-        skipped_count = total_entries - len(available_entries)
-        
-        result = f"Playlist title: {playlist_title}\n"
-        result += f"Number of {'audio tracks' if self.config.audio_only else 'videos'}: {entry_count} (downloaded) / {total_entries} (total)\n"
-        if skipped_count > 0:
-            result += f"Skipped {skipped_count} private or unavailable items\n"
-        result += "\n"
-        
-        for i, entry in enumerate(info['entries']):
+        entries = info['entries']
+        total_entries = len(entries)
+
+        # Loop-invariant pieces of the per-entry path
+        prefix = self.config.output_dir + os.sep
+        ext = self.config.file_extension
+
+        # Single pass over the entries: count available/unique videos and
+        # build the per-entry lines at the same time. Accumulate into a list
+        # and join once - repeated str += is O(N^2) on long playlists.
+        unique_titles = set()
+        available_count = 0
+        entry_lines = []
+        for i, entry in enumerate(entries):
             if entry:  # Some entries might be None if download failed or video is private
-                file_path = os.path.join(self.config.output_dir, f"{entry['title']}.{self.config.file_extension}")
-                result += f"{i+1}. {entry['title']} - Downloaded to: {file_path}\n"
+                available_count += 1
+                # Track unique video titles to avoid counting multiple parts of the same video
+                unique_titles.add(entry.get('title', ''))
+                file_path = f"{prefix}{entry['title']}.{ext}"
+                entry_lines.append(f"{i+1}. {entry['title']} - Downloaded to: {file_path}\n")
             else:
-                result += f"{i+1}. [Private or unavailable item - skipped]\n"
-                
-        return result
+                entry_lines.append(f"{i+1}. [Private or unavailable item - skipped]\n")
+
+        entry_count = len(unique_titles)
+        skipped_count = total_entries - available_count
+
+        parts = [f"Playlist title: {playlist_title}\n",
+                 f"Number of {'audio tracks' if self.config.audio_only else 'videos'}: {entry_count} (downloaded) / {total_entries} (total)\n"]
+        if skipped_count > 0:
+            parts.append(f"Skipped {skipped_count} private or unavailable items\n")
+        parts.append("\n")
+        parts.extend(entry_lines)
+
+        return ''.join(parts)
     
     def _format_single_video_result(self, info: Dict) -> str:
         """Format the result message for a single video download"""
-        file_path = os.path.join(self.config.output_dir, f"{info['title']}.{self.config.file_extension}")
+        file_path = f"{self.config.output_dir}{os.sep}{info['title']}.{self.config.file_extension}"
         return f"Downloaded to: {file_path}"
     
     def _create_notification(self, info: Dict) -> str:
         """Create a notification message based on download results"""
-        if is_playlist(self.config.url) and 'entries' in info:
-            available_entries = [entry for entry in info['entries'] if entry is not None]
-            
-            # Count unique video titles
-            unique_titles = set(entry.get('title', '') for entry in available_entries if entry)
+        if self._is_playlist and 'entries' in info:
+            entries = info['entries']
+            total_entries = len(entries)
+
+            # Count available entries and unique video titles in one pass
+            unique_titles = set()
+            available_count = 0
+            for entry in entries:
+                if entry is not None:
+                    available_count += 1
+                    unique_titles.add(entry.get('title', ''))
+
             entry_count = len(unique_titles)
-            total_entries = len(info['entries'])
-            skipped_count = total_entries - len(available_entries)
+            skipped_count = total_entries - available_count
             
             if skipped_count > 0:
                 return f"Download complete! {entry_count} {'audio tracks' if self.config.audio_only else 'videos'} downloaded, {skipped_count} skipped."
@@ -289,22 +670,51 @@ class DownloadManager:
         else:
             return "Download complete!"
 
-def download_video(url, video_password=None, audio_only=False, progress=gr.Progress()):
+def download_video(url, video_password=None, audio_only=False, max_workers=4, progress=gr.Progress()):
     """
     Download a video using yt-dlp
-    
+
     Args:
         url: URL of the video to download
         video_password: Password for protected videos (e.g., Vimeo)
         audio_only: Whether to download only the audio
+        max_workers: Number of playlist entries to download in parallel
         progress: Gradio progress bar
-        
+
     Returns:
         Path to the downloaded video file or error message
     """
-    config = DownloadConfig(url=url, video_password=video_password, audio_only=audio_only)
+    config = DownloadConfig(url=url, video_password=video_password, audio_only=audio_only,
+                            max_workers=int(max_workers))
     manager = DownloadManager(config, progress)
-    return manager.download()
+
+    # Run the download on a worker thread and stream per-entry completion
+    # lines into the status box as they arrive; Gradio renders each yield.
+    # The final yield replaces the stream with the full result message.
+    outcome = {}
+
+    def _run():
+        outcome['result'] = manager.download()
+
+    # Hand the worker a copy of the event-handler context: the gr.Success /
+    # gr.Warning toasts fired inside download() (and the progress pump it
+    # starts) resolve Gradio's contextvars at call time and degrade to
+    # console output on a bare thread.
+    ctx = contextvars.copy_context()
+    worker = threading.Thread(target=ctx.run, args=(_run,), daemon=True)
+    worker.start()
+
+    lines = []
+    while worker.is_alive() or not manager.interim_messages.empty():
+        try:
+            lines.append(manager.interim_messages.get(timeout=0.2))
+        except queue.Empty:
+            continue
+        yield "\n".join(lines)
+    worker.join()
+
+    result_message, _notification = outcome.get('result') or ("Download failed", None)
+    yield result_message
 
 # Create the Gradio interface
 with gr.Blocks(title="Video Downloader") as app:
@@ -325,35 +735,63 @@ with gr.Blocks(title="Video Downloader") as app:
             
             # Audio only checkbox
             audio_only_checkbox = gr.Checkbox(label="Download audio only (MP3/M4A)", value=False)
-            
+
+            # How many playlist entries to download at once
+            parallel_slider = gr.Slider(1, 8, value=4, step=1, label="Parallel downloads")
+
             download_button = gr.Button("Download", variant="primary", interactive=False)
+            clear_cache_button = gr.Button("Clear metadata cache")
         
         with gr.Column():
             output = gr.Textbox(label="Status", lines=10)  # Increased lines for more verbose output
     
-    # Function to check URL and show password field if it's a Vimeo URL
+    # Function to check URL and show password field if it's a Vimeo URL.
+    # The change event fires on every keystroke, so remember the last URL's
+    # answer and return it unchanged on repeats.
+    _last_url_check = {"url": None, "updates": None}
+
     def check_url_type(url):
+        if url == _last_url_check["url"]:
+            return _last_url_check["updates"]
+
         # Check if URL is empty to control download button state
         button_state = len(url.strip()) > 0
-        
+
         # Check if it's a Vimeo URL to control password field visibility
         password_visible = is_vimeo_url(url)
-        
-        return gr.update(visible=password_visible), gr.update(interactive=button_state)
+
+        updates = gr.update(visible=password_visible), gr.update(interactive=button_state)
+        _last_url_check["url"] = url
+        _last_url_check["updates"] = updates
+        return updates
     
-    # Update password field visibility and button state when URL changes
+    # Update password field visibility and button state when URL changes.
+    # The change event fires per keystroke; debounce it in the browser so
+    # the server only sees the URL once typing pauses.
     url_input.change(
         fn=check_url_type,
         inputs=url_input,
-        outputs=[password_input, download_button]
+        outputs=[password_input, download_button],
+        show_progress="hidden",
+        js="(url) => new Promise(r => { clearTimeout(window._url_debounce); window._url_debounce = setTimeout(() => r(url), 250); })"
     )
     
+    # Clear the persistent metadata cache
+    def clear_cache():
+        clear_meta_cache()
+        gr.Info("Metadata cache cleared")
+
+    clear_cache_button.click(fn=clear_cache)
+
     # Download button
     download_button.click(
         fn=download_video,
-        inputs=[url_input, password_input, audio_only_checkbox],
+        inputs=[url_input, password_input, audio_only_checkbox, parallel_slider],
         outputs=[output]
     )
 
 if __name__ == "__main__":
+    # Warm the yt-dlp import in the background while the browser opens; the
+    # first download then finds the module already loaded
+    threading.Thread(target=lambda: __import__('yt_dlp'), daemon=True).start()
     app.launch(inbrowser=True) 
\ No newline at end of file